@@ -0,0 +1,18 @@
+"""
+Gunicorn configuration for production deployments.
+
+All the large read-only structures in main.py (the quote corpus, indexes,
+preconstructed models and pre-serialized responses) are built at import time,
+so with preload_app the workers fork after that work is done and Linux
+copy-on-write shares one physical copy across all of them.
+
+Start with: gunicorn main:app -c gunicorn_conf.py
+"""
+
+import os
+
+bind = f"{os.environ.get('HOST', '0.0.0.0')}:{os.environ.get('PORT', '8000')}"
+workers = int(os.environ.get("WEB_CONCURRENCY", os.cpu_count() or 1))
+worker_class = "uvicorn.workers.UvicornWorker"
+preload_app = True
+keepalive = 5
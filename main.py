@@ -1,12 +1,21 @@
 from fastapi import FastAPI, HTTPException, Query, Request
-from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import HTMLResponse, JSONResponse
+from fastapi.responses import HTMLResponse, ORJSONResponse, Response
+import slowapi.wrappers
 from slowapi import Limiter, _rate_limit_exceeded_handler
 from slowapi.util import get_remote_address
 from slowapi.errors import RateLimitExceeded
-import json
-import random
+import orjson
+import os
+import pickle
+import re
+import sys
+from random import randrange
+import functools
+import gzip
+import hashlib
+from collections import defaultdict
 from typing import Optional, List
 from pydantic import BaseModel
 import uvicorn
@@ -37,8 +46,30 @@ class ApiInfo(BaseModel):
     categories: List[str]
     authors: List[str]
 
-# Rate limiting setup
-limiter = Limiter(key_func=get_remote_address)
+# Rate limiting setup. Counters live in Redis when REDIS_URL is set, so the
+# advertised limits hold globally when running multiple workers; the in-memory
+# fallback keeps local development dependency-free. The moving-window strategy
+# is enforced atomically server-side (one sorted set per client+route), so
+# bursts cannot race past the limit.
+limiter = Limiter(
+    key_func=get_remote_address,
+    storage_uri=os.environ.get("REDIS_URL", "memory://"),
+    strategy="moving-window",
+    headers_enabled=True,
+)
+
+# slowapi re-parses the limit string on every request; this app only ever
+# uses the handful of fixed limits below, so memoize the parser
+slowapi.wrappers.parse_many = functools.lru_cache(maxsize=None)(slowapi.wrappers.parse_many)
+
+# Per-route limits, defined once; the /health payload is derived from these
+RL_RANDOM = "30/minute"
+RL_LIST = "20/minute"
+RL_SEARCH = "15/minute"
+RL_META = "10/minute"
+RL_LANDING = "30/minute"
+RL_DETAIL = "30/minute"
+RL_HEALTH = "5/minute"
 
 # Initialize FastAPI app
 app = FastAPI(
@@ -46,16 +77,19 @@ app = FastAPI(
     description="Access over 1000 pieces of authentic Tibetan wisdom from the Dalai Lama, Buddhist masters, and traditional teachings",
     version="1.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    default_response_class=ORJSONResponse
 )
 
 # Add rate limiting to app
 app.state.limiter = limiter
 
-# Custom rate limit exceeded handler
+# Custom rate limit exceeded handler. The limiter injects Retry-After and
+# X-RateLimit-Limit/Remaining/Reset from the actual window state, so clients
+# can back off deterministically instead of retrying blind.
 @app.exception_handler(RateLimitExceeded)
 async def rate_limit_handler(request: Request, exc: RateLimitExceeded):
-    response = JSONResponse(
+    response = ORJSONResponse(
         status_code=429,
         content={
             "error": "Rate limit exceeded",
@@ -63,38 +97,261 @@ async def rate_limit_handler(request: Request, exc: RateLimitExceeded):
             "retry_after": "Please wait before making more requests"
         }
     )
-    response.headers["Retry-After"] = "60"
-    return response
-
-# CORS middleware
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+    return request.app.state.limiter._inject_headers(response, request.state.view_rate_limit)
+
+# CORS headers are constant for a public read-only API that always allows
+# "*", so there is nothing to negotiate per request
+CORS_HEADERS = [
+    (b"access-control-allow-origin", b"*"),
+    (b"access-control-allow-methods", b"GET, OPTIONS"),
+    (b"access-control-allow-headers", b"*"),
+]
+
+class StaticCORSMiddleware:
+    """Minimal ASGI middleware that appends the fixed CORS headers.
+
+    Replaces Starlette's CORSMiddleware, which re-inspects request headers
+    and rebuilds its header set on every call. Preflight OPTIONS requests
+    are answered directly with a 204.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        if scope["method"] == "OPTIONS":
+            await send({
+                "type": "http.response.start",
+                "status": 204,
+                "headers": CORS_HEADERS + [(b"access-control-max-age", b"600")],
+            })
+            await send({"type": "http.response.body", "body": b""})
+            return
+
+        async def send_with_cors(message):
+            if message["type"] == "http.response.start":
+                message["headers"] = list(message.get("headers") or []) + CORS_HEADERS
+            await send(message)
+
+        await self.app(scope, receive, send_with_cors)
+
+app.add_middleware(StaticCORSMiddleware)
+
+# Compress larger JSON bodies (wisdom listings and search pages are the main
+# beneficiaries); responses that arrive pre-compressed are passed through
+app.add_middleware(GZipMiddleware, minimum_size=512, compresslevel=5)
+
+# Load wisdom data. Parsing uses orjson, and the parsed corpus is cached in a
+# pickle next to the JSON (keyed on the JSON's mtime) so subsequent process
+# boots skip the parse entirely.
+WISDOM_FILE = "tibetan_quotes_collection.json"
+WISDOM_CACHE = WISDOM_FILE + ".cache.pkl"
+
+def load_wisdom_collection():
+    """Load the quote collection, preferring the pickle cache when fresh"""
+    json_mtime = os.path.getmtime(WISDOM_FILE)
+    try:
+        with open(WISDOM_CACHE, "rb") as f:
+            cached_mtime, quotes, meta = pickle.load(f)
+        if cached_mtime == json_mtime:
+            return quotes, meta
+    except (OSError, pickle.UnpicklingError, ValueError, EOFError):
+        pass
+
+    with open(WISDOM_FILE, "rb") as f:
+        data = orjson.loads(f.read())
+    quotes = data["tibetan_quotes_collection"]["quotes"]
+    meta = data["tibetan_quotes_collection"]["metadata"]
+
+    try:
+        with open(WISDOM_CACHE, "wb") as f:
+            pickle.dump((json_mtime, quotes, meta), f, protocol=pickle.HIGHEST_PROTOCOL)
+    except OSError:
+        pass  # read-only filesystem; just re-parse next boot
+
+    return quotes, meta
 
-# Load wisdom data
 try:
-    with open("tibetan_quotes_collection.json", "r", encoding="utf-8") as f:
-        data = json.load(f)
-    wisdom_data = data["tibetan_quotes_collection"]["quotes"]
-    metadata = data["tibetan_quotes_collection"]["metadata"]
+    wisdom_data, metadata = load_wisdom_collection()
 except FileNotFoundError:
     wisdom_data = []
     metadata = {"total_quotes": 0, "categories": [], "sources": []}
 
-# Extract unique values for filtering
-categories = list(set(wisdom["category"] for wisdom in wisdom_data))
-authors = list(set(wisdom["author"] for wisdom in wisdom_data))
-sources = list(set(wisdom["source"] for wisdom in wisdom_data))
+# The same few category/author/source strings repeat across the whole corpus
+# but parse as distinct objects; intern them so each unique value is stored
+# once and equality checks in the filters hit the pointer-compare fast path
+for wisdom in wisdom_data:
+    wisdom["category"] = sys.intern(wisdom["category"])
+    wisdom["author"] = sys.intern(wisdom["author"])
+    wisdom["source"] = sys.intern(wisdom["source"])
+
+# Extract unique values for filtering, sorted once at startup
+categories = sorted({wisdom["category"] for wisdom in wisdom_data})
+authors = sorted({wisdom["author"] for wisdom in wisdom_data})
+sources = sorted({wisdom["source"] for wisdom in wisdom_data})
+
+# Lowercased copies of the searchable fields, aligned with wisdom_data by index,
+# so filtering and search never re-lowercase the whole corpus per request
+TEXT_LC = [wisdom["text"].lower() for wisdom in wisdom_data]
+AUTHOR_LC = [wisdom["author"].lower() for wisdom in wisdom_data]
+SOURCE_LC = [wisdom["source"].lower() for wisdom in wisdom_data]
+CATEGORY_LC = [wisdom["category"].lower() for wisdom in wisdom_data]
+
+# One lowercase blob per entry (text/author/source, newline-separated) so a
+# substring search is a single contiguous scan instead of three lookups;
+# the newline separator keeps phrases from matching across field boundaries
+SEARCH_LC = [f"{t}\n{a}\n{s}" for t, a, s in zip(TEXT_LC, AUTHOR_LC, SOURCE_LC)]
+
+# Inverted index: lowercased category -> indices into wisdom_data, so the
+# common exact-category filter is a dict lookup instead of a full scan
+BY_CATEGORY = defaultdict(list)
+for i, category_lc in enumerate(CATEGORY_LC):
+    BY_CATEGORY[category_lc].append(i)
+
+# Author filter fast path: for queries that exactly match a known author
+# name, the substring-semantics result is precomputed per author, so the
+# common "?author=Dalai Lama XIV" lookup never scans the corpus
+BY_AUTHOR = {}
+for author in {wisdom["author"] for wisdom in wisdom_data}:
+    author_lc = author.lower()
+    BY_AUTHOR[author_lc] = [i for i, a in enumerate(AUTHOR_LC) if author_lc in a]
+
+# Direct id -> corpus index lookup so /wisdom/{id} avoids a linear scan
+BY_ID = {wisdom["id"]: i for i, wisdom in enumerate(wisdom_data)}
+
+# Validate every wisdom entry once at startup; the endpoints index into
+# this list instead of re-running pydantic validation per request
+WISDOM_MODELS = [Wisdom(**wisdom) for wisdom in wisdom_data]
+
+# Per-entry JSON bytes; list responses are assembled by joining these
+# instead of serializing the models again on every request
+WISDOM_JSON = [orjson.dumps(wisdom) for wisdom in wisdom_data]
+
+# /wisdom/random is the hottest route; pre-serialize every possible response
+# body so a request is one PRNG call plus a cached-bytes Response
+WISDOM_COUNT = len(wisdom_data)
+ALL_IDXS = range(WISDOM_COUNT)
+RANDOM_WISDOM_BYTES = [orjson.dumps({"wisdom": wisdom}) for wisdom in wisdom_data]
+
+# The documented default listing call (page 1, per_page 10, no filters) is
+# the most common, so its whole body is cached as one blob at startup
+DEFAULT_WISDOM_PAGE_BYTES = (
+    b'{"wisdom":[' + b",".join(WISDOM_JSON[:10])
+    + b'],"total":%d,"page":1,"per_page":10}' % WISDOM_COUNT
+)
 
-@app.get("/", response_class=HTMLResponse)
-@limiter.limit("30/minute")
-async def landing_page(request: Request):
-    """Landing page with API documentation and examples"""
-    html_content = """
+def wisdom_page_body(page_idxs, total, page, per_page) -> bytes:
+    """Build a WisdomListResponse-shaped JSON body from the cached bytes"""
+    return (
+        b'{"wisdom":[' + b",".join(WISDOM_JSON[i] for i in page_idxs)
+        + b'],"total":%d,"page":%d,"per_page":%d}' % (total, page, per_page)
+    )
+
+def wisdom_page_response(page_idxs, total, page, per_page):
+    return Response(
+        content=wisdom_page_body(page_idxs, total, page, per_page),
+        media_type="application/json"
+    )
+
+@functools.lru_cache(maxsize=256)
+def listing_page_bytes(page: int, per_page: int) -> bytes:
+    """Serialize one unfiltered listing page, memoized per (page, per_page).
+
+    per_page is already clamped to 100 by the Query validator, so the key
+    space stays bounded.
+    """
+    start_idx = (page - 1) * per_page
+    page_idxs = ALL_IDXS[start_idx:start_idx + per_page]
+    return wisdom_page_body(page_idxs, WISDOM_COUNT, page, per_page)
+
+@functools.lru_cache(maxsize=512)
+def search_page_bytes(search_term: str, page: int, per_page: int) -> bytes:
+    """Resolve and serialize one search result page, memoized per query.
+
+    The corpus is immutable after load, so repeat queries (landing-page
+    demos, crawlers) are answered from the cache without re-matching.
+    """
+    # Single whole-word queries hit the token index directly; phrases,
+    # partial words and punctuation fall back to the substring scan
+    if search_term in TOKEN_INDEX:
+        matched_idxs = TOKEN_INDEX[search_term]
+    else:
+        matched_idxs = [i for i in ALL_IDXS if search_term in SEARCH_LC[i]]
+
+    start_idx = (page - 1) * per_page
+    page_idxs = matched_idxs[start_idx:start_idx + per_page]
+    return wisdom_page_body(page_idxs, len(matched_idxs), page, per_page)
+
+# Whole-word token index over text/author/source. Landing-page queries are
+# almost always single words ("compassion"), which resolve here with one dict
+# lookup; anything else falls back to the substring scan in search_wisdom.
+TOKEN_RE = re.compile(r"[a-z0-9]+")
+TOKEN_INDEX = defaultdict(list)
+for i, blob in enumerate(SEARCH_LC):
+    for token in set(TOKEN_RE.findall(blob)):
+        TOKEN_INDEX[token].append(i)
+
+# The metadata endpoints serve fixed data, so serialize their responses
+# once at startup and return the cached bytes per request
+CATEGORIES_BYTES = orjson.dumps({"categories": categories, "count": len(categories)})
+AUTHORS_BYTES = orjson.dumps({"authors": authors, "count": len(authors)})
+SOURCES_BYTES = orjson.dumps({"sources": sources, "count": len(sources)})
+API_INFO_BYTES = orjson.dumps(ApiInfo(
+    name="Tibetan Wisdom API",
+    version="1.0.0",
+    description="Access over 1000 pieces of Tibetan wisdom from Buddhist masters and traditional teachings. Developed by Thukpa Labs.",
+    total_wisdom=len(wisdom_data),
+    categories=categories,
+    authors=authors
+).model_dump())
+
+# Strong ETags for the fixed payloads, so repeat clients and CDNs can be
+# answered with a bodyless 304 instead of re-serving the bytes
+STATIC_CACHE_CONTROL = "public, max-age=3600, immutable"
+
+def make_etag(body: bytes) -> str:
+    return f'"{hashlib.sha1(body).hexdigest()}"'
+
+CATEGORIES_ETAG = make_etag(CATEGORIES_BYTES)
+AUTHORS_ETAG = make_etag(AUTHORS_BYTES)
+SOURCES_ETAG = make_etag(SOURCES_BYTES)
+API_INFO_ETAG = make_etag(API_INFO_BYTES)
+
+# /health reports startup-time statistics that never change while the
+# process lives, so build and serialize the payload once. The advertised
+# rate_limits are global per client, not per worker: with REDIS_URL set the
+# limiter counts against shared Redis state across all workers.
+HEALTH_PAYLOAD = {
+    "status": "healthy",
+    "api_version": "1.0.0",
+    "total_wisdom": len(wisdom_data),
+    "available_categories": len(categories),
+    "available_authors": len(authors),
+    "rate_limits": {
+        "random_wisdom": RL_RANDOM,
+        "wisdom_listings": RL_LIST,
+        "search": RL_SEARCH,
+        "metadata": RL_META
+    }
+}
+HEALTH_BYTES = orjson.dumps(HEALTH_PAYLOAD)
+HEALTH_ETAG = make_etag(HEALTH_BYTES)
+# Short max-age: health is polled by monitors that should still revalidate
+HEALTH_CACHE_CONTROL = "public, max-age=60"
+
+def cached_json_response(request: Request, body: bytes, etag: str):
+    """Serve cached bytes with cache headers, honoring If-None-Match"""
+    headers = {"ETag": etag, "Cache-Control": STATIC_CACHE_CONTROL}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+# Landing page HTML never changes, so build the response once at import time
+LANDING_HTML = """
     <!DOCTYPE html>
     <html lang="en">
     <head>
@@ -439,33 +696,51 @@ print(wisdom['text'])</pre>
     </body>
     </html>
     """
-    return html_content
+
+LANDING_ETAG = make_etag(LANDING_HTML.encode("utf-8"))
+LANDING_HEADERS = {
+    "ETag": LANDING_ETAG,
+    "Cache-Control": STATIC_CACHE_CONTROL,
+    "Vary": "Accept-Encoding",
+}
+LANDING_BYTES = LANDING_HTML.encode("utf-8")
+# The landing page is the largest static payload; compress it once at import
+# instead of per request in the gzip middleware
+LANDING_GZ_BYTES = gzip.compress(LANDING_BYTES, compresslevel=6)
+LANDING_GZ_HEADERS = {**LANDING_HEADERS, "Content-Encoding": "gzip"}
+
+@app.get("/", response_class=HTMLResponse)
+@limiter.limit(RL_LANDING)
+async def landing_page(request: Request):
+    """Landing page with API documentation and examples"""
+    # Responses must be built per request: the rate limiter injects headers
+    # into whatever we return, so a shared instance would accumulate them
+    if request.headers.get("if-none-match") == LANDING_ETAG:
+        return Response(status_code=304, headers=LANDING_HEADERS)
+    if "gzip" in request.headers.get("accept-encoding", ""):
+        return HTMLResponse(content=LANDING_GZ_BYTES, headers=LANDING_GZ_HEADERS)
+    return HTMLResponse(content=LANDING_BYTES, headers=LANDING_HEADERS)
 
 @app.get("/info", response_model=ApiInfo)
-@limiter.limit("10/minute")
+@limiter.limit(RL_META)
 async def get_api_info(request: Request):
     """Get API information and statistics"""
-    return ApiInfo(
-        name="Tibetan Wisdom API",
-        version="1.0.0",
-        description="Access over 1000 pieces of Tibetan wisdom from Buddhist masters and traditional teachings. Developed by Thukpa Labs.",
-        total_wisdom=len(wisdom_data),
-        categories=categories,
-        authors=authors
-    )
+    return cached_json_response(request, API_INFO_BYTES, API_INFO_ETAG)
 
-@app.get("/wisdom/random", response_model=WisdomResponse)
-@limiter.limit("30/minute")
+@app.get("/wisdom/random")
+@limiter.limit(RL_RANDOM)
 async def get_random_wisdom(request: Request):
     """Get a random piece of wisdom from the collection"""
     if not wisdom_data:
         raise HTTPException(status_code=404, detail="No wisdom available")
-    
-    random_wisdom = random.choice(wisdom_data)
-    return WisdomResponse(wisdom=Wisdom(**random_wisdom))
 
-@app.get("/wisdom", response_model=WisdomListResponse)
-@limiter.limit("20/minute")
+    return Response(
+        content=RANDOM_WISDOM_BYTES[randrange(WISDOM_COUNT)],
+        media_type="application/json"
+    )
+
+@app.get("/wisdom")
+@limiter.limit(RL_LIST)
 async def get_wisdom(
     request: Request,
     page: int = Query(1, ge=1, description="Page number"),
@@ -475,32 +750,39 @@ async def get_wisdom(
     source: Optional[str] = Query(None, description="Filter by source")
 ):
     """Get paginated wisdom with optional filtering"""
-    filtered_wisdom = wisdom_data.copy()
-    
-    # Apply filters
+    if not (category or author or source):
+        # Fast path for the default first page, then the memoized cache for
+        # any other unfiltered page
+        if page == 1 and per_page == 10:
+            return Response(content=DEFAULT_WISDOM_PAGE_BYTES, media_type="application/json")
+        return Response(content=listing_page_bytes(page, per_page), media_type="application/json")
+
+    # Filter by index against the precomputed lowercase arrays
+    idxs = ALL_IDXS
+
     if category:
-        filtered_wisdom = [w for w in filtered_wisdom if w["category"].lower() == category.lower()]
-    
+        idxs = BY_CATEGORY.get(category.lower(), [])
+
     if author:
-        filtered_wisdom = [w for w in filtered_wisdom if author.lower() in w["author"].lower()]
-    
+        author_lc = author.lower()
+        if idxs is ALL_IDXS and author_lc in BY_AUTHOR:
+            idxs = BY_AUTHOR[author_lc]
+        else:
+            idxs = [i for i in idxs if author_lc in AUTHOR_LC[i]]
+
     if source:
-        filtered_wisdom = [w for w in filtered_wisdom if source.lower() in w["source"].lower()]
-    
+        source_lc = source.lower()
+        idxs = [i for i in idxs if source_lc in SOURCE_LC[i]]
+
     # Pagination
     start_idx = (page - 1) * per_page
     end_idx = start_idx + per_page
-    paginated_wisdom = filtered_wisdom[start_idx:end_idx]
-    
-    return WisdomListResponse(
-        wisdom=[Wisdom(**w) for w in paginated_wisdom],
-        total=len(filtered_wisdom),
-        page=page,
-        per_page=per_page
-    )
+    page_idxs = idxs[start_idx:end_idx]
 
-@app.get("/wisdom/search", response_model=WisdomListResponse)
-@limiter.limit("15/minute")
+    return wisdom_page_response(page_idxs, len(idxs), page, per_page)
+
+@app.get("/wisdom/search")
+@limiter.limit(RL_SEARCH)
 async def search_wisdom(
     request: Request,
     q: str = Query(..., description="Search query"),
@@ -508,73 +790,60 @@ async def search_wisdom(
     per_page: int = Query(10, ge=1, le=50, description="Wisdom pieces per page")
 ):
     """Search wisdom by keyword in text, author, or source"""
-    search_term = q.lower()
-    
-    filtered_wisdom = [
-        wisdom for wisdom in wisdom_data
-        if search_term in wisdom["text"].lower() 
-        or search_term in wisdom["author"].lower()
-        or search_term in wisdom["source"].lower()
-    ]
-    
-    # Pagination
-    start_idx = (page - 1) * per_page
-    end_idx = start_idx + per_page
-    paginated_wisdom = filtered_wisdom[start_idx:end_idx]
-    
-    return WisdomListResponse(
-        wisdom=[Wisdom(**w) for w in paginated_wisdom],
-        total=len(filtered_wisdom),
-        page=page,
-        per_page=per_page
+    return Response(
+        content=search_page_bytes(q.lower(), page, per_page),
+        media_type="application/json"
     )
 
 @app.get("/wisdom/categories")
-@limiter.limit("10/minute")
+@limiter.limit(RL_META)
 async def get_categories(request: Request):
     """Get all available categories"""
-    return {"categories": sorted(categories)}
+    return cached_json_response(request, CATEGORIES_BYTES, CATEGORIES_ETAG)
 
 @app.get("/wisdom/authors")
-@limiter.limit("10/minute")
+@limiter.limit(RL_META)
 async def get_authors(request: Request):
     """Get all available authors"""
-    return {"authors": sorted(authors)}
+    return cached_json_response(request, AUTHORS_BYTES, AUTHORS_ETAG)
 
 @app.get("/wisdom/sources")
-@limiter.limit("10/minute")
+@limiter.limit(RL_META)
 async def get_sources(request: Request):
     """Get all available sources"""
-    return {"sources": sorted(sources)}
+    return cached_json_response(request, SOURCES_BYTES, SOURCES_ETAG)
 
 @app.get("/wisdom/{wisdom_id}", response_model=WisdomResponse)
-@limiter.limit("30/minute")
-async def get_wisdom_by_id(request: Request, wisdom_id: int):
+@limiter.limit(RL_DETAIL)
+async def get_wisdom_by_id(request: Request, response: Response, wisdom_id: int):
     """Get a specific piece of wisdom by ID"""
-    wisdom = next((w for w in wisdom_data if w["id"] == wisdom_id), None)
-    
-    if not wisdom:
+    idx = BY_ID.get(wisdom_id)
+
+    if idx is None:
         raise HTTPException(status_code=404, detail="Wisdom not found")
-    
-    return WisdomResponse(wisdom=Wisdom(**wisdom))
+
+    # Individual wisdom entries never change, so clients can cache them long
+    response.headers["Cache-Control"] = "public, max-age=86400, immutable"
+    return WisdomResponse(wisdom=WISDOM_MODELS[idx])
 
 @app.get("/health")
-@limiter.limit("5/minute")
+@limiter.limit(RL_HEALTH)
 async def health_check(request: Request):
     """Health check endpoint with basic API statistics"""
-    return {
-        "status": "healthy",
-        "api_version": "1.0.0",
-        "total_wisdom": len(wisdom_data),
-        "available_categories": len(categories),
-        "available_authors": len(authors),
-        "rate_limits": {
-            "random_wisdom": "30/minute",
-            "wisdom_listings": "20/minute", 
-            "search": "15/minute",
-            "metadata": "10/minute"
-        }
-    }
+    headers = {"ETag": HEALTH_ETAG, "Cache-Control": HEALTH_CACHE_CONTROL}
+    if request.headers.get("if-none-match") == HEALTH_ETAG:
+        return Response(status_code=304, headers=headers)
+    return Response(content=HEALTH_BYTES, media_type="application/json", headers=headers)
 
 if __name__ == "__main__":
-    uvicorn.run(app, host="0.0.0.0", port=8000)
\ No newline at end of file
+    # uvloop + httptools replace the stdlib event loop and pure-Python HTTP
+    # parser; both ship with uvicorn[standard]. One worker per core; set
+    # REDIS_URL so the rate limits stay global across them.
+    uvicorn.run(
+        "main:app",
+        host=os.environ.get("HOST", "0.0.0.0"),
+        port=int(os.environ.get("PORT", 8000)),
+        workers=os.cpu_count(),
+        loop="uvloop",
+        http="httptools",
+    )
\ No newline at end of file